@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+
+"""
+Headless benchmarks of the simulation hot paths.
+
+Every kernel is run for several problem sizes and the best of a few rounds
+is reported as throughput (sweeps/s, steps/s, RHS evals/s, ...), together
+with the peak memory allocated by one round and, where the GUI draws the
+result, the time the GUI would spend rendering it with the Agg backend. The 
+results are saved as JSON so that two commits can be compared:
+
+    python benchmarks/bench.py -o before.json
+    python benchmarks/bench.py -o after.json --compare before.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tracemalloc
+from datetime import datetime
+from math import floor
+from time import perf_counter
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                os.pardir))
+
+from physics_demos.diffusion import Experiment
+from physics_demos.ising import Lattice
+from physics_demos.pendulum import Pendulum
+from physics_demos import walk1d, walk2d
+
+
+def new_axes():
+    """
+    Returns a fresh axes drawn by the Agg backend, or None when matplotlib is
+    not installed (the render part of the benchmarks is skipped then).
+    """
+    try:
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+    except ImportError:
+        return None
+    fig = Figure(figsize=(4, 4))
+    FigureCanvasAgg(fig)
+    return fig.add_subplot(1, 1, 1)
+
+
+# Each case returns a dict with the compute function, the amount of work done
+# by one call of compute and its unit. Cases which the GUI draws also return
+# render(i), drawing the i-th frame the way the GUI does, and the number of
+# frames the GUI draws for one call of compute, so that the compute and render
+# times refer to the same work.
+
+def lattice_update(L):
+    model = Lattice(1.0, L, 0.0)
+    model.beta = 0.44
+    ax = new_axes()
+
+    def render(i):
+        ax.clear()
+        ax.pcolormesh(model.s, cmap='RdBu')
+        ax.figure.canvas.draw()
+
+    # ising2d.py redraws the lattice after every sweep
+    return {"compute": model.update, "render": ax and render, "frames": 1,
+            "work": 1, "unit": "sweeps/s"}
+
+def lattice_energy(L):
+    model = Lattice(1.0, L, 0.0)
+    return {"compute": model.get_energy, "render": None,
+            "work": 1, "unit": "evals/s"}
+
+def pendulum_derivs(n_evals):
+    p = Pendulum(th1=120.0, th2=-10.0)
+
+    def compute():
+        for i in range(n_evals):
+            p.derivs(p.state, 0.0)
+
+    return {"compute": compute, "render": None,
+            "work": n_evals, "unit": "RHS evals/s"}
+
+def pendulum_solve(N):
+    pendulums = [Pendulum(th1=120.0 + i, th2=-10.0) for i in range(N)]
+    n_evals = [0]
+    for p in pendulums:
+        def counting(state, t, derivs=p.derivs):
+            n_evals[0] += 1
+            return derivs(state, t)
+        p.derivs = counting
+    ax = new_axes()
+
+    def compute():
+        n_evals[0] = 0
+        for p in pendulums:
+            p.integrate()
+
+    if ax is not None:
+        l = pendulums[0].L1 + pendulums[0].L2
+        ax.set_xlim(-l, l)
+        ax.set_ylim(-l, l)
+        ax.grid()
+        line, = ax.plot([], [], 'o-', lw=2, animated=True)
+        time_text = ax.text(0.05, 0.9, '', transform=ax.transAxes,
+                            animated=True)
+        canvas = ax.figure.canvas
+        canvas.draw()
+        background = canvas.copy_from_bbox(ax.bbox)
+
+    def render(i):
+        # frame i of the animations of all pendulums, one after another,
+        # blitted over the static background like FuncAnimation(blit=True)
+        # does; the 25 ms pacing of the animation is not included
+        n_t = len(pendulums[0].t)
+        p = pendulums[(i//n_t) % N]
+        i = i % n_t
+        canvas.restore_region(background)
+        line.set_data([0, p.x1[i], p.x2[i]], [0, p.y1[i], p.y2[i]])
+        time_text.set_text('time = %.1fs'%(i*p.dt))
+        ax.draw_artist(line)
+        ax.draw_artist(time_text)
+        canvas.blit(ax.bbox)
+
+    # Pendulum.show animates every time step of each solution
+    case = {"compute": compute, "render": ax and render,
+            "frames": N*len(pendulums[0].t),
+            "work": lambda: n_evals[0], "unit": "RHS evals/s"}
+    try:
+        import scipy.integrate
+    except ImportError:
+        case["skip"] = "scipy is not installed"
+    return case
+
+def experiment_move(n, n_steps = 100):
+    dif = Experiment(n=n, barrier=True)
+    ax = new_axes()
+
+    def compute():
+        for ii in range(n_steps):
+            dif.move()
+
+    def render(i):
+        ax.clear()
+        ax.scatter(dif.x, dif.y)
+        ax.figure.canvas.draw()
+
+    # diffusion.py draws the particles after every step
+    return {"compute": compute, "render": ax and render, "frames": n_steps,
+            "work": n*n_steps, "unit": "walker steps/s"}
+
+def move_randomly(n, n_steps = 100):
+    walkers = walk1d.Walker_data_wrapper()
+    walkers.set_number_of_walkers(n)
+    walkers.reset_walker()
+    ax = new_axes()
+    hist = new_axes()
+
+    def compute():
+        for ii in range(n_steps):
+            walkers.move_randomly()
+
+    def render(i):
+        ax.clear()
+        ax.scatter(np.transpose(walkers.position), np.zeros([n, 1]))
+        ax.figure.canvas.draw()
+        if i % 10 == 0:
+            hist.clear()
+            hist.hist(np.transpose(walkers.position),
+                      bins=floor(n_steps/10) + 1, align='mid')
+            hist.figure.canvas.draw()
+
+    # sim1d.py draws the walkers after every step and their histogram after
+    # every tenth step
+    return {"compute": compute, "render": ax and render, "frames": n_steps,
+            "work": n*n_steps, "unit": "walker steps/s"}
+
+def walk2d_redraw(n_steps, n_walkers = 10):
+    walkers = walk2d.Walker_data_wrapper()
+    walkers.set_number_of_walkers(n_walkers)
+    walkers.set_number_of_steps(n_steps)
+    ax = new_axes()
+    paths = []
+
+    def compute():
+        paths[:] = [walkers.walk() for i_walker in range(n_walkers)]
+
+    def render(i):
+        ax.clear()
+        for x, y in paths:
+            ax.plot(x, y)
+        ax.figure.canvas.draw()
+
+    # sim1Tk.py plots all trajectories and draws the canvas once
+    return {"compute": compute, "render": ax and render, "frames": 1,
+            "work": n_steps*n_walkers, "unit": "walker steps/s"}
+
+
+CASES = {
+    "Lattice.update": (lattice_update, "L", [8, 16, 32, 64]),
+    "Lattice.get_energy": (lattice_energy, "L", [8, 16, 32, 64]),
+    "Pendulum.derivs": (pendulum_derivs, "n_evals", [1000, 10000]),
+    "Pendulum.solve": (pendulum_solve, "N", [1, 4, 16]),
+    "Experiment.move": (experiment_move, "n", [50, 500, 5000]),
+    "move_randomly": (move_randomly, "n", [50, 500, 5000]),
+    "sim1Tk.redraw": (walk2d_redraw, "n_steps", [1000, 10000, 100000]),
+}
+
+QUICK = {"Lattice.update": [8, 16], "Lattice.get_energy": [8, 16],
+         "Pendulum.derivs": [1000], "Pendulum.solve": [1],
+         "Experiment.move": [50, 500], "move_randomly": [50, 500],
+         "sim1Tk.redraw": [1000, 10000]}
+
+
+def best_time(func, repeat):
+    times = []
+    for _ in range(repeat):
+        t0 = perf_counter()
+        func()
+        times.append(perf_counter() - t0)
+    return min(times)
+
+def render_time(render, frames, repeat, max_frames = 20):
+    """
+    Time the GUI spends drawing the given number of frames. At most 
+    max_frames are drawn, the rest is extrapolated from the time per frame.
+    """
+    n = min(frames, max_frames)
+
+    def draw():
+        for i in range(n):
+            render(i)
+
+    return best_time(draw, repeat)*frames/n
+
+def peak_memory(func):
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def run_case(name, setup, param, size, repeat, render):
+    np.random.seed(0)
+    case = setup(size)
+    result = {"name": name, "param": param, "size": size, "unit": case["unit"]}
+    if "skip" in case:
+        result["skipped"] = case["skip"]
+        return result
+
+    compute = best_time(case["compute"], repeat)
+    work = case["work"]() if callable(case["work"]) else case["work"]
+    result.update({"compute_s": compute,
+                   "throughput": work/compute,
+                   "peak_bytes": peak_memory(case["compute"])})
+    if render and case["render"]:
+        result["render_s"] = render_time(case["render"], case["frames"],
+                                         repeat)
+        result["render_fraction"] = result["render_s"]/(compute +
+                                                        result["render_s"])
+    return result
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"],
+                              capture_output=True, text=True, check=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))
+                              ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def print_result(r, old = None):
+    label = "%-20s %-8s %8d"%(r["name"], r["param"], r["size"])
+    if "skipped" in r:
+        print("%s  skipped: %s"%(label, r["skipped"]))
+        return
+    line = "%s %14.4g %-16s %9.2f MB"%(label, r["throughput"], r["unit"],
+                                       r["peak_bytes"]/2**20)
+    if "render_s" in r:
+        line += "  render %5.1f %%"%(100*r["render_fraction"])
+    if old is not None and "throughput" in old:
+        line += "  x%.2f"%(r["throughput"]/old["throughput"])
+    print(line)
+
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument("-o", "--output", help="save the results as JSON")
+    parser.add_argument("--compare", help="JSON results of an earlier run")
+    parser.add_argument("-k", "--cases", nargs="+", choices=sorted(CASES),
+                        default=sorted(CASES), help="kernels to run")
+    parser.add_argument("-r", "--repeat", type=int, default=3)
+    parser.add_argument("--quick", action="store_true",
+                        help="only the small problem sizes")
+    parser.add_argument("--no-render", action="store_true",
+                        help="skip the rendering part")
+    args = parser.parse_args(argv)
+
+    old = {}
+    if args.compare:
+        with open(args.compare) as f:
+            for r in json.load(f)["results"]:
+                old[(r["name"], r["size"])] = r
+
+    results = []
+    for name in args.cases:
+        setup, param, sizes = CASES[name]
+        for size in (QUICK[name] if args.quick else sizes):
+            r = run_case(name, setup, param, size, args.repeat,
+                         not args.no_render)
+            print_result(r, old.get((name, size)))
+            results.append(r)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"commit": git_commit(),
+                       "date": datetime.now().isoformat(timespec="seconds"),
+                       "python": platform.python_version(),
+                       "numpy": np.__version__,
+                       "machine": platform.machine(),
+                       "repeat": args.repeat,
+                       "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,9 @@
+"""
+Physics of the demos without any GUI. Importing this package (or any of its 
+modules) costs only the NumPy import; matplotlib and scipy are imported 
+lazily by the few methods that need them, tkinter only by the GUI scripts.
+"""
+
+from physics_demos.diffusion import Experiment
+from physics_demos.ising import Binning, Lattice, Measurement
+from physics_demos.pendulum import Pendulum
@@ -0,0 +1,101 @@
+"""
+Headless command line entry point, e.g.
+
+    python -m physics_demos ising --beta 0.3 0.44 0.6
+    python -m physics_demos pendulum --th1 120 --th2 -10
+"""
+
+import argparse
+
+import numpy as np
+
+from physics_demos.diffusion import Experiment
+from physics_demos.ising import Lattice
+from physics_demos.pendulum import Pendulum
+from physics_demos import walk1d, walk2d
+
+
+def ising(args):
+    for beta in args.beta:
+        model = Lattice(args.J, args.L, args.h)
+        model.beta = beta
+        measurement = model.measure(target_error=args.target_error,
+                                    max_sweeps=args.max_sweeps)
+        print(measurement.summary())
+
+def pendulum(args):
+    p = Pendulum(th1=args.th1, w1=args.w1, th2=args.th2, w2=args.w2)
+    p.integrate()
+    th1, w1, th2, w2 = np.degrees(p.y[-1])
+    print('t = %.2f s: th1 = %f, w1 = %f, th2 = %f, w2 = %f'%(
+          p.t[-1], th1, w1, th2, w2))
+
+def diffusion(args):
+    dif = Experiment(n=args.n, barrier=args.barrier)
+    for ii in range(args.steps):
+        dif.move()
+    print('<x> = %f, <y> = %f, <x^2> = %f, <y^2> = %f'%(
+          dif.x.mean(), dif.y.mean(), (dif.x**2).mean(), (dif.y**2).mean()))
+
+def walk1(args):
+    walkers = walk1d.Walker_data_wrapper()
+    walkers.set_number_of_walkers(args.walkers)
+    walkers.set_number_of_steps(args.steps)
+    walkers.reset_walker()
+    for ii in range(walkers.n_steps):
+        walkers.move_randomly()
+    print('<x> = %f, sqrt(<x^2>) = %f'%(
+          walkers.position.mean(), np.sqrt((walkers.position**2).mean())))
+
+def walk2(args):
+    walkers = walk2d.Walker_data_wrapper()
+    walkers.set_number_of_walkers(args.walkers)
+    walkers.set_number_of_steps(args.steps)
+    walkers.set_step_len(args.step_len)
+    r2 = [x[-1]**2 + y[-1]**2 for x, y in
+          (walkers.walk() for i_walker in range(walkers.n_walkers))]
+    print('sqrt(<r^2>) = %f'%np.sqrt(np.mean(r2)))
+
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(prog='python -m physics_demos',
+                                     description='Headless runs of the demos.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    p = commands.add_parser('ising', help='measure E and |m| of the Ising model')
+    p.add_argument('--beta', type=float, nargs='+', default=[0.44])
+    p.add_argument('--J', type=float, default=1.0)
+    p.add_argument('--L', type=int, default=30)
+    p.add_argument('--h', type=float, default=0.0)
+    p.add_argument('--target-error', type=float, default=0.005)
+    p.add_argument('--max-sweeps', type=int, default=5000)
+    p.set_defaults(func=ising)
+
+    p = commands.add_parser('pendulum', help='integrate the double pendulum')
+    for name in ('th1', 'w1', 'th2', 'w2'):
+        p.add_argument('--' + name, type=float, default=0.0)
+    p.set_defaults(func=pendulum)
+
+    p = commands.add_parser('diffusion', help='diffusion in a box')
+    p.add_argument('--n', type=int, default=50)
+    p.add_argument('--steps', type=int, default=1000)
+    p.add_argument('--barrier', action='store_true')
+    p.set_defaults(func=diffusion)
+
+    p = commands.add_parser('walk1d', help='one-dimensional random walk')
+    p.add_argument('--walkers', type=int, default=50)
+    p.add_argument('--steps', type=int, default=50)
+    p.set_defaults(func=walk1)
+
+    p = commands.add_parser('walk2d', help='two-dimensional random walk')
+    p.add_argument('--walkers', type=int, default=1)
+    p.add_argument('--steps', type=int, default=100000)
+    p.add_argument('--step-len', type=float, default=1.0)
+    p.set_defaults(func=walk2)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,326 @@
+"""
+Two-dimensional Ising model on a periodic square lattice, simulated with the 
+Metropolis algorithm, together with the measurement engine which decides how 
+many sweeps each temperature needs.
+"""
+
+import numpy as np
+
+
+class Lattice:
+    def __init__(self, J: float, L: int, h: float):
+        self.L = L
+        self.h = h
+        self.J = J
+        self.n_steps = 100
+        self.get_random_state()
+        self.set_beta(2.0)
+        self.energy = self.get_energy()
+        self.m = np.sum(self.s)
+        self.X, self.Y = np.meshgrid(range(L), range(L))
+
+    def get_energy(self):
+        energy = 0.0
+        for i in range(self.L):
+            for j in range(self.L):
+                energy -= 0.5 * self.s[i][j]*(self.J*(self.s[i][(j+1)%self.L] +
+                                                      self.s[i][(j-1)%self.L] +
+                                                      self.s[(i+1)%self.L][j] +
+                                                      self.s[(i-1)%self.L][j])+
+                                              self.h)
+        return energy
+
+    def get_random_state(self):
+        self.s = 2*np.random.randint(2, size=(self.L, self.L)) - 1
+        self.energy = self.get_energy()
+        self.m = np.sum(self.s)
+
+    def update(self):
+        for i in range(self.L):
+            for j in range(self.L):
+                dE = 2*self.s[i][j]*(self.J*(self.s[i][(j+1)%self.L] + 
+                                             self.s[i][(j-1)%self.L] +
+                                             self.s[(i+1)%self.L][j] + 
+                                             self.s[(i-1)%self.L][j])+
+                                     self.h)
+
+                if np.random.rand() < np.exp(-dE*self.beta):
+                    self.energy += dE
+                    self.m -= 2*self.s[i][j]
+                    self.s[i][j] *= -1
+
+    def set_beta(self, val):
+        self.beta = int(val)/1000
+
+    def set_field(self, val):
+        self.h = int(val)/10
+
+    def draw(self, canvas):
+        import matplotlib.pyplot as plt
+
+        plt.pcolormesh(self.s, cmap=plt.cm.RdBu);
+        plt.title('Beta = %f, h = %f, E = %f, m = %f'%(
+                  self.beta, self.h, self.energy/(self.L**2), 
+                  self.m/(self.L**2)))
+        plt.pause(0.01)
+        canvas.draw()
+
+    def set_n_steps(self, val):
+        self.n_steps = int(val)
+
+    def simulate(self, callback = None):
+        """
+        Runs n_steps sweeps. The optional callback is called after every 
+        sweep, e.g. to redraw the lattice.
+        """
+        for n in range(self.n_steps):
+            self.update()
+            if callback is not None:
+                callback()
+
+    def measure(self, callback = None, **kwargs):
+        """
+        Equilibrates the lattice at the current beta and field and then 
+        measures energy and magnetisation per site until their statistical 
+        errors drop below the target. The number of sweeps therefore depends 
+        on how strongly correlated the Markov chain is at this temperature.
+        Keyword arguments are passed to Measurement.
+        """
+        measurement = Measurement(self, **kwargs)
+        measurement.run(callback)
+        return measurement
+
+
+def integrated_time(series, c = 6):
+    """
+    Integrated autocorrelation time of a stored time series, summing the 
+    normalised autocorrelation function up to the smallest window W with 
+    W >= c*tau (Sokal's automatic windowing). Uncorrelated data give 0.5.
+    """
+    x = np.asarray(series, dtype = float)
+    x = x - x.mean()
+    n = len(x)
+    if n < 2 or not np.any(x):
+        return 0.5
+    f = np.fft.rfft(x, 2*n)
+    acf = np.fft.irfft(f*np.conjugate(f))[:n]
+    acf /= acf[0]
+    tau = 0.5
+    for W in range(1, n):
+        tau += acf[W]
+        if W >= c*tau:
+            break
+    return max(tau, 0.5)
+
+
+class Binning:
+    """
+    Streaming binning (blocking) analysis of a single observable. 
+
+    Every new value is added to level 0. Each pair of consecutive values on 
+    level k is averaged and passed to level k+1, so level k holds bins of 
+    2**k measurements. Only running sums are stored, the time series itself 
+    is never kept in memory.
+    """
+    def __init__(self, n_levels = 20, min_bins = 64):
+        self.n_levels = n_levels
+        self.min_bins = min_bins  # bins needed for a trustworthy error
+        self.n_ratios = 3         # level ratios checked for the plateau
+        self.n_tau = 10           # shortest bins on the plateau, in tau
+        self.tolerance = 1.05     # largest growth of the error on a plateau
+        self.n = 0
+        self.sums = np.zeros(n_levels)
+        self.sums2 = np.zeros(n_levels)
+        self.counts = np.zeros(n_levels, dtype = int)
+        self.pending = [None]*n_levels
+
+    def add(self, x):
+        self.n += 1
+        for level in range(self.n_levels):
+            self.sums[level] += x
+            self.sums2[level] += x*x
+            self.counts[level] += 1
+            if self.pending[level] is None:
+                self.pending[level] = x
+                break
+            x = 0.5*(self.pending[level] + x)
+            self.pending[level] = None
+
+    def mean(self):
+        if self.n == 0:
+            return np.nan
+        return self.sums[0]/self.counts[0]
+
+    def level_error(self, level):
+        """
+        Standard error of the mean estimated from bins on the given level.
+        """
+        c = self.counts[level]
+        if c < 2:
+            return 0.0
+        var = (self.sums2[level]/c - (self.sums[level]/c)**2)*c/(c - 1)
+        return np.sqrt(max(var, 0.0)/c)
+
+    def level(self):
+        """
+        The coarsest level which still has at least min_bins bins.
+        """
+        level = 0
+        while (level + 1 < self.n_levels and 
+               self.counts[level + 1] >= self.min_bins):
+            level += 1
+        return level
+
+    def error(self):
+        """
+        Error of the mean from the coarsest level. It is trustworthy only 
+        once plateau() holds, before that it is an underestimate.
+        """
+        if self.n == 0:
+            return np.nan
+        return self.level_error(self.level())
+
+    def tau(self):
+        """
+        Integrated autocorrelation time (in sweeps) estimated from the ratio 
+        of the binned and the naive error. Uncorrelated data give 0.5.
+        """
+        if self.n == 0:
+            return np.nan
+        naive = self.level_error(0)
+        if naive == 0.0:
+            return 0.5
+        return 0.5*(self.error()/naive)**2
+
+    def plateau(self):
+        """
+        True once the binned error has stopped growing: the coarsest bins 
+        are at least n_tau autocorrelation times long and the error grows by 
+        less than the tolerance (plus twice its own statistical error) 
+        between each of the last n_ratios + 1 levels with at least min_bins 
+        bins. tau() can never exceed half of the bin length, so requiring 
+        bins of n_tau*tau() with n_tau well above 2 is a real test.
+        """
+        level = self.level()
+        if level < self.n_ratios or 2**level < self.n_tau*self.tau():
+            return False
+        for k in range(level - self.n_ratios + 1, level + 1):
+            lower = self.level_error(k - 1)
+            if lower == 0.0:
+                continue
+            # relative statistical error of the error estimate from c bins
+            noise = 1/np.sqrt(2*(self.counts[k] - 1))
+            if self.level_error(k)/lower >= self.tolerance + 2*noise:
+                return False
+        return True
+
+    def converged(self, target_error):
+        return self.plateau() and self.error() <= target_error
+
+
+class Measurement:
+    """
+    Measurement engine running on top of a Lattice. It detects equilibration, 
+    then samples the energy and the absolute magnetisation per site (the sign 
+    of m is meaningless in a finite lattice, it flips from time to time) and 
+    stops as soon as both reach the target statistical error.
+    """
+    def __init__(self, lattice, target_error = 0.005, n_check = 10,
+                 max_sweeps = 5000):
+        self.lattice = lattice
+        self.target_error = target_error
+        self.n_check = n_check         # sweeps between convergence checks
+        self.max_sweeps = max_sweeps   # hard limit for both phases together
+        self.n_sweeps = 0
+        self.n_equilibration = 0
+        self.equilibrated = False
+        self.converged = False
+        self.energy = Binning()
+        self.magnetisation = Binning()
+
+    def sweep(self):
+        self.lattice.update()
+        self.n_sweeps += 1
+        N = self.lattice.L**2
+        return self.lattice.energy/N, abs(self.lattice.m)/N
+
+    @staticmethod
+    def _drifting(series, n_tau = 10):
+        """
+        Compares the averages of the last two quarters of the series. If they 
+        differ by more than twice their combined error, the series is still 
+        drifting. The first half is always treated as a possible transient. 
+        The errors account for the autocorrelation time and each quarter has 
+        to be at least n_tau autocorrelation times long, otherwise a slowly 
+        drifting series would look stationary. tau is estimated from the whole 
+        series, a transient only makes it longer and the test stricter.
+        """
+        n = len(series)//4
+        a = np.array(series[-2*n:-n])
+        b = np.array(series[-n:])
+        tau = integrated_time(series)
+        if n < n_tau*tau:
+            return True
+        err = np.sqrt(2*tau*(a.var() + b.var())/n)
+        return abs(a.mean() - b.mean()) > 2*err + 1e-12
+
+    def equilibrate(self, callback = None):
+        E, m = [], []
+        while self.n_sweeps < self.max_sweeps:
+            for _ in range(self.n_check):
+                e, mag = self.sweep()
+                E.append(e)
+                m.append(mag)
+            if callback is not None:
+                callback()
+            if len(E) >= 4*self.n_check and not (self._drifting(E) or 
+                                                 self._drifting(m)):
+                self.equilibrated = True
+                break
+        self.n_equilibration = self.n_sweeps
+        return self.equilibrated
+
+    def run(self, callback = None):
+        """
+        Equilibrates the lattice and measures until the target error or the 
+        sweep limit is reached. The optional callback is called every n_check 
+        sweeps, e.g. to redraw the lattice.
+        """
+        self.equilibrate(callback)
+        while self.n_sweeps < self.max_sweeps:
+            for _ in range(self.n_check):
+                e, mag = self.sweep()
+                self.energy.add(e)
+                self.magnetisation.add(mag)
+            if callback is not None:
+                callback()
+            if (self.energy.converged(self.target_error) and 
+                self.magnetisation.converged(self.target_error)):
+                self.converged = True
+                break
+        return self.results()
+
+    def results(self):
+        return {"beta": self.lattice.beta,
+                "h": self.lattice.h,
+                "E": self.energy.mean(),
+                "E_err": self.energy.error(),
+                "tau_E": self.energy.tau(),
+                "m": self.magnetisation.mean(),
+                "m_err": self.magnetisation.error(),
+                "tau_m": self.magnetisation.tau(),
+                "n_equilibration": self.n_equilibration,
+                "n_sweeps": self.n_sweeps,
+                "equilibrated": self.equilibrated,
+                "converged": self.converged}
+
+    def summary(self):
+        r = self.results()
+        return ('Beta = %f, h = %f: E = %f +- %f (tau = %.1f), '
+                '|m| = %f +- %f (tau = %.1f), %d + %d sweeps%s'%(
+                r["beta"], r["h"], r["E"], r["E_err"], r["tau_E"],
+                r["m"], r["m_err"], r["tau_m"], r["n_equilibration"],
+                r["n_sweeps"] - r["n_equilibration"],
+                "" if r["converged"] else 
+                " (target error not reached)" if r["equilibrated"] else
+                " (not equilibrated, nothing measured)"))
@@ -0,0 +1,74 @@
+"""
+Opt-in per-phase timers for the interactive demos. Profiling is switched on 
+by setting the environment variable PHYSICS_DEMOS_PROFILE (to anything but 
+an empty string or 0); otherwise phase() returns a shared no-op context 
+manager and nothing is measured.
+"""
+
+import os
+import sys
+from contextlib import contextmanager, nullcontext
+from time import perf_counter
+
+
+_DISABLED = nullcontext()
+
+
+class Timers:
+    def __init__(self, enabled = None):
+        if enabled is None:
+            enabled = os.environ.get("PHYSICS_DEMOS_PROFILE", "") not in ("", "0")
+        self.enabled = enabled
+        self._nested = []  # time spent in nested phases, per open phase
+        self.reset()
+
+    def reset(self):
+        self.totals = {}
+        self.own = {}
+        self.counts = {}
+
+    def phase(self, name):
+        """
+        Accumulates the time spent in the with-block under the given name. 
+        Phases may be nested, e.g. 'draw' inside 'simulate'; the own time of 
+        a phase excludes the time spent in the phases nested in it.
+        """
+        if not self.enabled:
+            return _DISABLED
+        return self._timed(name)
+
+    @contextmanager
+    def _timed(self, name):
+        self._nested.append(0.0)
+        t0 = perf_counter()
+        try:
+            yield
+        finally:
+            dt = perf_counter() - t0
+            nested = self._nested.pop()
+            if self._nested:
+                self._nested[-1] += dt
+            self.totals[name] = self.totals.get(name, 0.0) + dt
+            self.own[name] = self.own.get(name, 0.0) + dt - nested
+            self.counts[name] = self.counts.get(name, 0) + 1
+
+    def dump(self, title = "", file = None):
+        """
+        Prints the accumulated timers and resets them.
+        """
+        if not self.enabled or not self.totals:
+            return
+        file = sys.stderr if file is None else file
+        print("--- %s"%title if title else "---", file=file)
+        print("%-12s %6s %12s %12s %12s"%(
+              "phase", "calls", "total [s]", "own [s]", "own [ms/call]"),
+              file=file)
+        for name, own in sorted(self.own.items(), key=lambda x: -x[1]):
+            n = self.counts[name]
+            print("%-12s %6d %12.4f %12.4f %12.3f"%(
+                  name, n, self.totals[name], own, 1000*own/n), file=file)
+        self.reset()
+
+
+# Shared instance used by the GUI scripts
+timers = Timers()
@@ -0,0 +1,30 @@
+"""
+One-dimensional random walk of many independent walkers (the drunken sailor).
+"""
+
+from math import floor
+
+import numpy as np
+
+
+class Walker_data_wrapper:
+    def __init__(self):
+        self.n_steps = 50
+        self.n_walkers = 50
+        self.position = np.zeros([1, self.n_walkers], dtype = int)
+
+    # Setters
+    def set_number_of_walkers(self, val):
+        self.n_walkers = floor(int(val))
+
+    def set_number_of_steps(self, val):
+        self.n_steps = floor(int(val))
+
+    def set_step_len(self, val):
+        self.step_len = float(val)
+
+    def reset_walker(self):
+        self.position = np.zeros([1, self.n_walkers], dtype = int)
+    
+    def move_randomly(self):
+        self.position += 2*(np.random.rand(1,self.n_walkers)<0.5)-1
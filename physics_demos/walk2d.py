@@ -0,0 +1,33 @@
+"""
+Two-dimensional random walk, the continuous limit of which is diffusion.
+"""
+
+from math import sqrt, floor
+
+import numpy as np
+
+
+class Walker_data_wrapper:
+    def __init__(self):
+        self.step_len = 1
+        self.n_steps = 100000
+        self.n_walkers = 1
+
+    # Setters
+    def set_number_of_walkers(self, val):
+        self.n_walkers = floor(int(val))
+
+    def set_number_of_steps(self, val):
+        self.n_steps = floor(int(val))
+
+    def set_step_len(self, val):
+        self.step_len = float(val)
+
+    def walk(self):
+        """
+        Generates the trajectory of a single walker, returns its x and y 
+        coordinates after every step.
+        """
+        x = np.cumsum(self.step_len*(2*np.random.rand(1, self.n_steps)-1)/sqrt(self.n_steps))
+        y = np.cumsum(self.step_len*(2*np.random.rand(1, self.n_steps)-1)/sqrt(self.n_steps))
+        return x, y
@@ -8,25 +8,10 @@ from matplotlib.backends.backend_tkagg import (
 from matplotlib.backend_bases import key_press_handler
 from matplotlib.figure import Figure
 
-from math import sqrt, floor
-
 import numpy as np
 
-class Walker_data_wrapper:
-    def __init__(self):
-        self.step_len = 1
-        self.n_steps = 100000
-        self.n_walkers = 1
-
-    # Setters
-    def set_number_of_walkers(self, val):
-        self.n_walkers = floor(int(val))
-
-    def set_number_of_steps(self, val):
-        self.n_steps = floor(int(val))
-
-    def set_step_len(self, val):
-        self.step_len = float(val)
+from physics_demos.profiling import timers
+from physics_demos.walk2d import Walker_data_wrapper
 
 walkers = Walker_data_wrapper()
 
@@ -68,13 +53,16 @@ def redraw():
     subplot.clear()
 
     for i_walker in range(walkers.n_walkers):
-        x = np.cumsum(walkers.step_len*(2*np.random.rand(1, walkers.n_steps)-1)/sqrt(walkers.n_steps))
-        y = np.cumsum(walkers.step_len*(2*np.random.rand(1, walkers.n_steps)-1)/sqrt(walkers.n_steps))
-
-        subplot.axis([-8, 8, -8, 8])
-        subplot.grid()
-        subplot.plot(x, y)
-    canvas.draw()
+        with timers.phase("walk"):
+            x, y = walkers.walk()
+
+        with timers.phase("plot"):
+            subplot.axis([-8, 8, -8, 8])
+            subplot.grid()
+            subplot.plot(x, y)
+    with timers.phase("canvas"):
+        canvas.draw()
+    timers.dump("redraw")
     
 
 def _quit():
@@ -9,32 +9,13 @@ from matplotlib.backend_bases import key_press_handler
 import matplotlib.pyplot as plt
 from matplotlib.figure import Figure
 
-from math import sqrt, floor
+from math import floor
 
 import numpy as np
 
+from physics_demos.profiling import timers
+from physics_demos.walk1d import Walker_data_wrapper
 
-class Walker_data_wrapper:
-    def __init__(self):
-        self.n_steps = 50
-        self.n_walkers = 50
-        self.position = np.zeros([1, self.n_walkers], dtype = int)
-
-    # Setters
-    def set_number_of_walkers(self, val):
-        self.n_walkers = floor(int(val))
-
-    def set_number_of_steps(self, val):
-        self.n_steps = floor(int(val))
-
-    def set_step_len(self, val):
-        self.step_len = float(val)
-
-    def reset_walker(self):
-        self.position = np.zeros([1, self.n_walkers], dtype = int)
-    
-    def move_randomly(self):
-        self.position += 2*(np.random.rand(1,self.n_walkers)<0.5)-1
 
 walkers = Walker_data_wrapper()
 
@@ -95,22 +76,27 @@ def redraw():
     
     
     for ii in range(walkers.n_steps):
-        walkers.move_randomly()
-        subplot.clear()    
-        subplot.axis([-walkers.n_steps/2, walkers.n_steps/2, -1, 1])
-        subplot.grid()
-        
-        subplot.scatter(np.transpose(walkers.position) , np.transpose(z), color='blue')
-        #  plt.pause(0.05)
-        canvas2.draw()
+        with timers.phase("move"):
+            walkers.move_randomly()
+        with timers.phase("plot"):
+            subplot.clear()    
+            subplot.axis([-walkers.n_steps/2, walkers.n_steps/2, -1, 1])
+            subplot.grid()
+            
+            subplot.scatter(np.transpose(walkers.position) , np.transpose(z), color='blue')
+            #  plt.pause(0.05)
+        with timers.phase("canvas"):
+            canvas2.draw()
 
         if ii % 10 == 0:
-            subplot_distri.clear()
-            #  subplot_distri.hist(np.transpose(walkers.position), bins = 'auto', align = 'mid')
-            subplot_distri.hist(np.transpose(walkers.position), bins = floor(walkers.n_steps/10) + 1, align = 'mid')
-            #subplot_distri.axis([-walkers.n_steps/2, walkers.n_steps/2, 0, walkers.n_walkers])
-            subplot_distri.set_xlim(left = -walkers.n_steps/2, right = walkers.n_steps/2)
-            canvas.draw()
+            with timers.phase("histogram"):
+                subplot_distri.clear()
+                #  subplot_distri.hist(np.transpose(walkers.position), bins = 'auto', align = 'mid')
+                subplot_distri.hist(np.transpose(walkers.position), bins = floor(walkers.n_steps/10) + 1, align = 'mid')
+                #subplot_distri.axis([-walkers.n_steps/2, walkers.n_steps/2, 0, walkers.n_walkers])
+                subplot_distri.set_xlim(left = -walkers.n_steps/2, right = walkers.n_steps/2)
+            with timers.phase("canvas"):
+                canvas.draw()
 
     subplot_distri.clear()
     #subplot_distri.hist(np.transpose(walkers.position), bins = 'auto')
@@ -118,6 +104,7 @@ def redraw():
     #subplot_distri.axis([-walkers.n_steps/2, walkers.n_steps/2, 0, walkers.n_walkers])
     subplot_distri.set_xlim(left = -walkers.n_steps/2, right = walkers.n_steps/2)
     canvas.draw()
+    timers.dump("redraw")
     
 def _quit():
     root.quit()     # stops mainloop
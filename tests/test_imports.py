@@ -0,0 +1,27 @@
+"""
+The physics_demos package has to stay importable without the GUI stack, so 
+that batch jobs and worker processes pay only for NumPy.
+"""
+
+import os
+import subprocess
+import sys
+
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+
+CODE = """
+import importlib, pkgutil, sys
+import physics_demos
+for module in pkgutil.iter_modules(physics_demos.__path__):
+    importlib.import_module("physics_demos." + module.name)
+heavy = sorted(name for name in sys.modules
+               if name.split(".")[0] in ("matplotlib", "scipy", "tkinter"))
+print(" ".join(heavy))
+"""
+
+
+def test_import_is_light():
+    out = subprocess.run([sys.executable, "-c", CODE], cwd=ROOT,
+                         capture_output=True, text=True, check=True).stdout
+    assert out.split() == []
@@ -0,0 +1,110 @@
+"""
+Checks of the error analysis against AR(1) series x[i] = rho*x[i-1] + noise, 
+whose integrated autocorrelation time is known exactly: (1 + rho)/(2(1 - rho)).
+"""
+
+import numpy as np
+
+from physics_demos.ising import Binning, Lattice, Measurement, integrated_time
+
+
+def ar1(rho, n, seed = 0):
+    rng = np.random.default_rng(seed)
+    noise = rng.standard_normal(n)
+    x = np.empty(n)
+    x[0] = noise[0]/np.sqrt(1 - rho**2)
+    for i in range(1, n):
+        x[i] = rho*x[i - 1] + noise[i]
+    return x
+
+def exact_tau(rho):
+    return 0.5*(1 + rho)/(1 - rho)
+
+def exact_error(rho, n):
+    """
+    Exact standard error of the mean of n consecutive values of the series.
+    """
+    return np.sqrt(((1 + rho)/(1 - rho) - 
+                    2*rho*(1 - rho**n)/(n*(1 - rho)**2))/(n*(1 - rho**2)))
+
+def binned(series):
+    b = Binning()
+    for x in series:
+        b.add(x)
+    return b
+
+
+def test_uncorrelated():
+    b = binned(ar1(0.0, 20000))
+    assert b.plateau()
+    assert abs(b.tau()/exact_tau(0.0) - 1) < 0.3
+
+def test_plateau_reached():
+    rho = 0.9
+    b = binned(ar1(rho, 100000))
+    assert b.plateau()
+    assert abs(b.tau()/exact_tau(rho) - 1) < 0.3
+    assert b.converged(target_error=1.0)
+
+def test_bins_shorter_than_tau():
+    # the longest bins with enough statistics have 256 values, while tau is 
+    # about 100 and 1000, respectively
+    for rho in (0.99, 0.999):
+        b = binned(ar1(rho, 20000))
+        assert not b.plateau()
+        assert not b.converged(target_error=1e6)
+
+def test_integrated_time():
+    for rho in (0.0, 0.5, 0.9):
+        tau = integrated_time(ar1(rho, 100000))
+        assert abs(tau/exact_tau(rho) - 1) < 0.15
+
+def test_drifting():
+    x = ar1(0.9, 2000)
+    assert not Measurement._drifting(x)
+    assert Measurement._drifting(x + np.linspace(0.0, 20.0, 2000))
+
+def test_error_at_stop():
+    # stopping at the first convergence check which passes must not pick 
+    # an underestimated error
+    rho, ratios, taus = 0.9, [], []
+    for seed in range(10):
+        b = Binning()
+        for i, x in enumerate(ar1(rho, 100000, seed)):
+            b.add(x)
+            if (i + 1) % 10 == 0 and b.converged(target_error=0.3):
+                break
+        assert b.n < 100000
+        ratios.append(b.error()/exact_error(rho, b.n))
+        taus.append(b.tau()/exact_tau(rho))
+    assert 0.9 < np.mean(ratios) < 1.1
+    assert min(ratios) > 0.7
+    assert 0.85 < np.mean(taus) < 1.15
+
+def test_empty():
+    b = Binning()
+    assert np.isnan(b.mean()) and np.isnan(b.error()) and np.isnan(b.tau())
+    assert not b.converged(target_error=1.0)
+
+def test_measure():
+    np.random.seed(2)
+    model = Lattice(1.0, 8, 0.0)
+    model.beta = 0.2
+    measurement = model.measure(target_error=0.02, max_sweeps=5000)
+    r = measurement.results()
+    assert r["equilibrated"] and r["converged"]
+    assert r["n_sweeps"] < 5000
+    assert r["E_err"] <= 0.02
+    # exact energy per site of the infinite lattice (Onsager), the finite 
+    # size correction is negligible this far from the critical point
+    assert abs(r["E"] + 0.42823) < 3*r["E_err"]
+
+def test_measure_not_equilibrated():
+    np.random.seed(0)
+    model = Lattice(1.0, 8, 0.0)
+    model.beta = 0.44
+    measurement = model.measure(max_sweeps=30)
+    r = measurement.results()
+    assert not r["equilibrated"] and not r["converged"]
+    assert np.isnan(r["E"]) and np.isnan(r["E_err"]) and np.isnan(r["m"])
+    assert "not equilibrated" in measurement.summary()
@@ -0,0 +1,40 @@
+import io
+from time import sleep
+
+from physics_demos.profiling import Timers
+
+
+def test_disabled():
+    timers = Timers(enabled=False)
+    with timers.phase("a"):
+        with timers.phase("b"):
+            pass
+    assert timers.totals == {} and timers.counts == {}
+    out = io.StringIO()
+    timers.dump(file=out)
+    assert out.getvalue() == ""
+
+def test_nested_phases():
+    timers = Timers(enabled=True)
+    for _ in range(2):
+        with timers.phase("outer"):
+            sleep(0.01)
+            with timers.phase("inner"):
+                sleep(0.02)
+    assert timers.counts == {"outer": 2, "inner": 2}
+    assert timers.totals["outer"] >= timers.totals["inner"] >= 0.04
+    # the own time of the outer phase excludes the nested one
+    assert abs(timers.own["outer"] + timers.totals["inner"] -
+               timers.totals["outer"]) < 1e-9
+    assert 0.02 <= timers.own["outer"] < timers.totals["outer"]
+    assert timers.own["inner"] == timers.totals["inner"]
+
+def test_dump_prints_and_resets():
+    timers = Timers(enabled=True)
+    with timers.phase("draw"):
+        pass
+    out = io.StringIO()
+    timers.dump("redraw", file=out)
+    text = out.getvalue()
+    assert "--- redraw" in text and "draw" in text
+    assert timers.totals == {} and timers.own == {} and timers.counts == {}